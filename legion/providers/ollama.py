@@ -1,10 +1,16 @@
 """Ollama-specific implementation of the LLM interface"""
 
 import ast
-import json
-from typing import Any, Dict, List, Optional, Sequence, Type
+import asyncio
+import functools
+import io
+import logging
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Type
 
-from pydantic import BaseModel
+import orjson
+from pydantic import BaseModel, ValidationError
 
 from ..errors import ProviderError
 from ..interface.base import LLMInterface
@@ -18,6 +24,84 @@ from ..interface.schemas import (
 from ..interface.tools import BaseTool
 from . import ProviderFactory
 
+logger = logging.getLogger(__name__)
+
+# Connection pool shared by every request a provider instance makes
+MAX_KEEPALIVE_CONNECTIONS = 16
+MAX_CONNECTIONS = 32
+KEEPALIVE_EXPIRY = 60.0
+CONNECT_TIMEOUT = 10.0
+
+# Tool sets whose schemas are kept by each provider, least recently used first out
+TOOL_SCHEMA_CACHE_SIZE = 32
+
+# Number of prompts row-marshaled into a single batched request
+DEFAULT_BATCH_SIZE = 8
+
+BATCH_PROMPT = (
+    "Answer each of the following {count} queries independently.\n"
+    "Respond ONLY with a JSON object of the form {{\"responses\": [...]}} where "
+    "\"responses\" is a list of exactly {count} strings, one answer per query, "
+    "in the same order as the queries. No other text."
+)
+
+# Ollama role for each message role; function results are sent as the assistant
+_ROLE_TO_STR = {
+    Role.SYSTEM: "system",
+    Role.USER: "user",
+    Role.ASSISTANT: "assistant",
+    Role.FUNCTION: "assistant",
+    Role.TOOL: "tool"
+}
+
+# Shared usage for responses that report no token counts
+_EMPTY_USAGE = TokenUsage(prompt_tokens=0, completion_tokens=0, total_tokens=0)
+
+
+def _dumps(obj: Any, option: int = 0) -> str:
+    """Serialize to a JSON string with orjson"""
+    # Stringify non-str keys the way json.dumps does
+    return orjson.dumps(obj, option=option | orjson.OPT_NON_STR_KEYS).decode()
+
+
+_loads = orjson.loads
+
+
+def _arguments_json(arguments: Any) -> str:
+    """Encode tool-call arguments as a JSON string"""
+    # Some models return arguments already encoded as a JSON string
+    if isinstance(arguments, str):
+        return arguments
+    return _dumps(arguments)
+
+
+class _DeferredPrettyJSON:
+    """Pretty-print an object as JSON only when a log record is emitted"""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+    def __str__(self) -> str:
+        return _dumps(self.obj, orjson.OPT_INDENT_2)
+
+
+@functools.lru_cache(maxsize=64)
+def _options(temperature: float) -> Mapping[str, Any]:
+    """Get the read-only chat options for a sampling temperature"""
+    return MappingProxyType({"temperature": temperature})
+
+
+@functools.lru_cache(maxsize=128)
+def _schema_prompt(schema: Type[BaseModel]) -> str:
+    """Build the JSON-mode system prompt for a response schema"""
+    return (
+        "You must respond with valid JSON that matches this schema:\n"
+        f"{_dumps(schema.model_json_schema(), orjson.OPT_INDENT_2)}\n\n"
+        "Respond ONLY with valid JSON. No other text."
+    )
+
 
 class OllamaFactory(ProviderFactory):
     """Factory for creating Ollama providers"""
@@ -33,43 +117,58 @@ class OllamaProvider(LLMInterface):
         """Initialize provider with both sync and async clients"""
         super().__init__(config, debug)
         self._async_client = None  # Initialize async client lazily
+        self._async_ready = False
+        self._async_init_lock = asyncio.Lock()
+        self._fast_response = bool(getattr(config, "fast_response", False))
+        self._batch_threshold = self._batch_option("batch_threshold", None)
+        self._batch_size = self._batch_option("batch_size", DEFAULT_BATCH_SIZE)
+        self._tool_schema_cache: OrderedDict[Tuple[int, ...], Tuple[Sequence[BaseTool], List[Dict[str, Any]]]] = OrderedDict()
+
+    def _batch_option(self, name: str, default: Optional[int]) -> Optional[int]:
+        """Read a batching option from the config, rejecting non-positive values"""
+        value = getattr(self.config, name, default)
+        if value is not None and (isinstance(value, bool) or not isinstance(value, int) or value < 1):
+            raise ProviderError(f"Ollama {name} must be a positive integer, got {value!r}")
+        return value
+
+    def _client_options(self, http2: bool = False) -> Dict[str, Any]:
+        """Build the httpx settings passed through by the Ollama clients"""
+        import httpx
+
+        # Non-streamed generations can run for minutes, so only bound reads
+        # when the caller asked for a timeout
+        read_timeout = self.config.timeout if "timeout" in self.config.model_fields_set else None
+
+        return {
+            "limits": httpx.Limits(
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=MAX_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY
+            ),
+            "timeout": httpx.Timeout(read_timeout, connect=CONNECT_TIMEOUT),
+            "http2": http2
+        }
 
     def _setup_client(self) -> None:
         """Initialize Ollama client"""
         try:
             from ollama import Client
-            self.client = Client(host=self.config.base_url or "http://localhost:11434")
+            self.client = Client(
+                host=self.config.base_url or "http://localhost:11434",
+                **self._client_options()
+            )
         except Exception as e:
             raise ProviderError(f"Failed to initialize Ollama client: {str(e)}")
 
     def _format_messages(self, messages: List[Message]) -> List[Dict[str, Any]]:
         """Convert messages to Ollama format"""
-        ollama_messages = []
-
-        for msg in messages:
-            if msg.role == Role.SYSTEM:
-                # Ollama handles system messages as special user messages
-                ollama_messages.append({
-                    "role": "system",
-                    "content": msg.content
-                })
-                continue
-
-            if msg.role == Role.TOOL:
-                # Format tool results
-                ollama_messages.append({
-                    "role": "tool",
-                    "content": msg.content,
-                    "name": msg.name
-                })
-            else:
-                # Format regular messages
-                ollama_messages.append({
-                    "role": "user" if msg.role == Role.USER else "assistant",
-                    "content": msg.content
-                })
-
-        return ollama_messages
+        # Tool results also carry the name of the tool that produced them
+        return [
+            {"role": _ROLE_TO_STR[msg.role], "content": msg.content, "name": msg.name}
+            if msg.role is Role.TOOL
+            else {"role": _ROLE_TO_STR[msg.role], "content": msg.content}
+            for msg in messages
+        ]
 
     def _format_arguments(
             self,
@@ -83,33 +182,88 @@ class OllamaProvider(LLMInterface):
                 args = arguments
         else:
                 args = arguments
-        return json.dumps(args)
+        return _arguments_json(args)
+
+    def _create_response(self, **fields: Any) -> ModelResponse:
+        """Build a response, skipping validation when fast_response is enabled"""
+        if self._fast_response:
+            return ModelResponse.model_construct(**fields)
+        return ModelResponse(**fields)
+
+    def _create_usage(self, prompt_tokens: int, completion_tokens: int) -> TokenUsage:
+        """Build token usage, skipping validation when fast_response is enabled"""
+        fields = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens
+        }
+        if self._fast_response:
+            return TokenUsage.model_construct(**fields)
+        return TokenUsage(**fields)
+
+    def _tool_schemas(self, tools: Sequence[BaseTool]) -> List[Dict[str, Any]]:
+        """Get tool schemas, building them only once per set of tools"""
+        key = tuple(id(tool) for tool in tools)
+        cached = self._tool_schema_cache.get(key)
+        if cached is not None:
+            self._tool_schema_cache.move_to_end(key)
+            return cached[1]
+
+        # Keep the tools referenced so their ids cannot be reused while cached
+        cached = (tuple(tools), [tool.get_schema() for tool in tools])
+        self._tool_schema_cache[key] = cached
+        if len(self._tool_schema_cache) > TOOL_SCHEMA_CACHE_SIZE:
+            self._tool_schema_cache.popitem(last=False)
+        return cached[1]
+
+    def _accumulate_streaming_response(self, chunks: Iterable[Any]) -> Any:
+        """Fold a streamed Ollama chat response into a single response object"""
+        content = io.StringIO()
+        tool_calls = []
+        final = None
+
+        for chunk in chunks:
+            if chunk is None:
+                continue
 
+            message = getattr(chunk, "message", None)
+            if message is not None:
+                if message.content:
+                    content.write(message.content)
+                if message.tool_calls:
+                    tool_calls.extend(message.tool_calls)
+
+            # The final chunk carries the prompt_eval_count/eval_count totals
+            final = chunk
+
+        if final is None:
+            raise ProviderError("Ollama returned an empty response stream")
+
+        message = final.message.model_copy(update={
+            "content": content.getvalue(),
+            "tool_calls": tool_calls or None
+        })
+        return final.model_copy(update={"message": message})
 
     def _get_chat_completion(
         self,
         messages: List[Message],
         model: str,
         temperature: float,
-        stream: Optional[bool] = False
+        max_tokens: Optional[int] = None
     ) -> ModelResponse:
         """Get a basic chat completion"""
         try:
-            # Build options dictionary
-            options = {
-                "temperature": temperature
-            }
-
-            response = self.client.chat(
+            response = self._accumulate_streaming_response(self.client.chat(
                 model=model,
                 messages=self._format_messages(messages),
-                options=options,
-                stream=stream
-            )
+                options=_options(temperature),
+                stream=True
+            ))
 
-            return ModelResponse(
+            return self._create_response(
                 content=self._extract_content(response),
-                raw_response=response,
+                raw_response=self._response_to_dict(response),
                 usage=self._extract_usage(response),
                 tool_calls=None
             )
@@ -127,25 +281,20 @@ class OllamaProvider(LLMInterface):
     ) -> ModelResponse:
         """Get completion with tool usage"""
         try:
-            # Build options dictionary
-            options = {
-                "temperature": temperature
-            }
-
-            response = self.client.chat(
+            response = self._accumulate_streaming_response(self.client.chat(
                 model=model,
                 messages=self._format_messages(messages),
-                tools=[tool.get_schema() for tool in tools],
-                options=options,
-                stream=False
-            )
+                tools=self._tool_schemas(tools),
+                options=_options(temperature),
+                stream=True
+            ))
 
             # Process tool calls if any
             tool_calls = self._extract_tool_calls(response)
 
-            return ModelResponse(
+            return self._create_response(
                 content=self._extract_content(response),
-                raw_response=response,
+                raw_response=self._response_to_dict(response),
                 usage=self._extract_usage(response),
                 tool_calls=tool_calls
             )
@@ -163,102 +312,145 @@ class OllamaProvider(LLMInterface):
         """Get a chat completion formatted as JSON"""
         try:
             # Format schema for system prompt
-            schema_json = schema.model_json_schema()
-            schema_prompt = (
-                "You must respond with valid JSON that matches this schema:\n"
-                f"{json.dumps(schema_json, indent=2)}\n\n"
-                "Respond ONLY with valid JSON. No other text."
-            )
+            schema_prompt = _schema_prompt(schema)
 
             # Create new messages list with modified system message
-            formatted_messages = []
             system_content = schema_prompt
+            conversation = []
 
             for msg in messages:
                 if msg.role == Role.SYSTEM:
                     # Combine existing system message with schema prompt
                     system_content = f"{msg.content}\n\n{schema_prompt}"
                 else:
-                    formatted_messages.append(msg)
-
-            # Add system message at the start
-            formatted_messages.insert(0, Message(
-                role=Role.SYSTEM,
-                content=system_content
-            ))
+                    conversation.append(msg)
 
-            # Build options dictionary
-            options = {
-                "temperature": temperature,
-                "format": "json"  # Enable JSON mode
-            }
+            # Put the system message first without an insert or a Message round-trip
+            formatted_messages = [{"role": "system", "content": system_content}]
+            formatted_messages.extend(self._format_messages(conversation))
 
-            response = self.client.chat(
+            response = self._accumulate_streaming_response(self.client.chat(
                 model=model,
-                messages=self._format_messages(formatted_messages),
-                options=options,
-                stream=False
-            )
+                messages=formatted_messages,
+                format="json",  # Enable JSON mode
+                options=_options(temperature),
+                stream=True
+            ))
 
             # Validate response against schema
-            try:
-                content = self._extract_content(response)
-                data = json.loads(content)
-                schema.model_validate(data)
-            except Exception as e:
-                raise ProviderError(f"Invalid JSON response: {str(e)}")
+            content = self._extract_content(response)
+            self._validate_json(schema, content)
 
-            return ModelResponse(
+            return self._create_response(
                 content=content,
-                raw_response=response,
+                raw_response=self._response_to_dict(response),
                 usage=self._extract_usage(response),
                 tool_calls=None
             )
         except Exception as e:
             raise ProviderError(f"Ollama JSON completion failed: {str(e)}")
 
+    def _validate_json(self, schema: Type[BaseModel], content: str) -> None:
+        """Parse and validate a JSON response against its schema in a single pass"""
+        try:
+            schema.model_validate_json(content)
+        except ValidationError as e:
+            raise ProviderError(f"Invalid JSON response: {str(e)}") from e
+
+    def _split_system_prompt(self, messages: List[Message]) -> Tuple[str, List[Message]]:
+        """Separate the system prompt from the rest of a conversation"""
+        system = "\n\n".join(msg.content for msg in messages if msg.role == Role.SYSTEM)
+        return system, [msg for msg in messages if msg.role != Role.SYSTEM]
+
+    def _marshal_prompt_groups(self, prompt_groups: List[List[Message]]) -> List[Dict[str, Any]]:
+        """Combine independent conversations into one numbered batch request"""
+        split = [self._split_system_prompt(messages) for messages in prompt_groups]
+        system_prompts = {system for system, _ in split}
+        if len(system_prompts) > 1:
+            raise ProviderError("Batched prompts must share the same system prompt")
+
+        if any(len(conversation) != 1 for _, conversation in split):
+            raise ProviderError("Batched prompts must each be a single non-system message")
+
+        queries = [
+            f"Query {index}:\n{conversation[0].content}"
+            for index, (_, conversation) in enumerate(split, start=1)
+        ]
+
+        batch_prompt = BATCH_PROMPT.format(count=len(prompt_groups))
+        system_prompt = system_prompts.pop()
+        return [
+            {"role": "system", "content": f"{system_prompt}\n\n{batch_prompt}" if system_prompt else batch_prompt},
+            {"role": "user", "content": "\n\n".join(queries)}
+        ]
+
+    def _unmarshal_batch_response(self, response: Any, count: int) -> List[ModelResponse]:
+        """Split a batched response back into one response per prompt"""
+        try:
+            answers = _loads(self._extract_content(response))["responses"]
+        except Exception as e:
+            raise ProviderError(f"Invalid batched response: {str(e)}")
+
+        if not isinstance(answers, list) or len(answers) != count:
+            raise ProviderError(f"Batched response did not contain {count} answers")
+
+        # Spread the shared request's token usage so the parts sum to the whole
+        usage = self._extract_usage(response)
+        prompt_tokens, prompt_extra = divmod(usage.prompt_tokens, count)
+        completion_tokens, completion_extra = divmod(usage.completion_tokens, count)
+        raw_response = self._response_to_dict(response)
+
+        responses = []
+        for index, answer in enumerate(answers):
+            part_prompt = prompt_tokens + (prompt_extra if index == 0 else 0)
+            part_completion = completion_tokens + (completion_extra if index == 0 else 0)
+            responses.append(self._create_response(
+                content=answer if isinstance(answer, str) else _dumps(answer),
+                raw_response={**raw_response, "batch_index": index, "batch_size": count},
+                usage=self._create_usage(part_prompt, part_completion),
+                tool_calls=None
+            ))
+        return responses
+
     def _extract_usage(self, response: Any) -> TokenUsage:
         """Extract token usage from Ollama response"""
-        # Ollama might not provide token counts
-        return TokenUsage(
-            prompt_tokens=getattr(response, "prompt_tokens", 0),
-            completion_tokens=getattr(response, "completion_tokens", 0),
-            total_tokens=getattr(response, "total_tokens", 0)
-        )
+        # Ollama reports counts as prompt_eval_count/eval_count, and may omit them
+        prompt_tokens = response.prompt_eval_count or 0
+        completion_tokens = response.eval_count or 0
+        if not prompt_tokens and not completion_tokens:
+            return _EMPTY_USAGE
+
+        return self._create_usage(prompt_tokens, completion_tokens)
 
     def _extract_content(self, response: Any) -> str:
         """Extract content from Ollama response"""
-        if not hasattr(response, "message"):
-            return ""
-
-        if hasattr(response.message, "content"):
-            return response.message.content.strip()
-
-        return ""
+        message = getattr(response, "message", None)
+        return message.content.strip() if message and message.content else ""
 
     def _extract_tool_calls(self, response: Any) -> Optional[List[Dict[str, Any]]]:
         """Extract tool calls from Ollama response"""
-        if not hasattr(response, "message") or not hasattr(response.message, "tool_calls"):
+        message = getattr(response, "message", None)
+        if not message or not message.tool_calls:
             return None
 
         tool_calls = []
-        for tool_call in response.message.tool_calls:
-            # Generate a unique ID if none provided
-            call_id = getattr(tool_call, "id", f"call_{len(tool_calls)}")
+        for index, tool_call in enumerate(message.tool_calls):
+            # Ollama tool calls carry no id of their own
+            call_id = f"call_{index}"
 
             tool_calls.append({
                 "id": call_id,
                 "type": "function",
                 "function": {
                     "name": tool_call.function.name,
-                    "arguments": json.dumps(tool_call.function.arguments)
+                    "arguments": _arguments_json(tool_call.function.arguments)
                 }
             })
 
             if self.debug:
-                print(f"\nExtracted tool call: {json.dumps(tool_calls[-1], indent=2)}")
+                logger.debug("Extracted tool call: %s", _DeferredPrettyJSON(tool_calls[-1]))
 
-        return tool_calls if tool_calls else None
+        return tool_calls
 
     async def _asetup_client(self) -> None:
         """Initialize async Ollama client"""
@@ -266,14 +458,23 @@ class OllamaProvider(LLMInterface):
         try:
             self._async_client = AsyncClient(
                 host=self.config.base_url or "http://localhost:11434",
+                # Opt-in: needs httpx[http2] and a TLS endpoint; plain http:// stays HTTP/1.1
+                **self._client_options(http2=getattr(self.config, "http2", False))
             )
         except Exception as e:
             raise ProviderError(f"Failed to initialize async Ollama client: {str(e)}")
 
     async def _ensure_async_client(self) -> None:
         """Ensure async client is initialized"""
-        if self._async_client is None:
-            await self._asetup_client()
+        if self._async_ready:
+            return
+
+        # Concurrent first callers must not each build (and leak) a client
+        async with self._async_init_lock:
+            if not self._async_ready:
+                if self._async_client is None:
+                    await self._asetup_client()
+                self._async_ready = True
 
     async def _aget_chat_completion(self, messages, model, temperature, max_tokens = None):
         """Get a basic chat completion asynchronously"""
@@ -281,11 +482,11 @@ class OllamaProvider(LLMInterface):
             await self._ensure_async_client()
             response = await self._async_client.chat(
                 model=model,
-                messages=[msg.model_dump() for msg in messages],
-                options={"temperature": temperature}
+                messages=self._format_messages(messages),
+                options=_options(temperature)
             )
 
-            return ModelResponse(
+            return self._create_response(
                 content=self._extract_content(response),
                 raw_response=self._response_to_dict(response),
                 usage=self._extract_usage(response),
@@ -294,6 +495,95 @@ class OllamaProvider(LLMInterface):
         except Exception as e:
             raise ProviderError(f"Ollama async completion failed: {str(e)}")
 
+    async def abatch_complete(
+        self,
+        batches: List[List[Message]],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None
+    ) -> List[ModelResponse]:
+        """Get chat completions for independent conversations concurrently
+
+        Requests are bounded by the keep-alive pool size so each one reuses
+        a warm connection. Responses are returned in the order of ``batches``.
+
+        When ``config.batch_threshold`` is set and at least that many
+        single-turn conversations sharing one system prompt are given, they
+        are instead row-marshaled ``config.batch_size`` at a time into single
+        requests. Multi-turn conversations are always sent on their own.
+        """
+        await self._ensure_async_client()
+        semaphore = asyncio.Semaphore(MAX_KEEPALIVE_CONNECTIONS)
+
+        if self._batch_threshold and len(batches) >= self._batch_threshold:
+            split = [self._split_system_prompt(messages) for messages in batches]
+            single_turn = all(len(conversation) == 1 for _, conversation in split)
+            if single_turn and len({system for system, _ in split}) == 1:
+                return await self._aget_batched_chat_completion(
+                    batches,
+                    model,
+                    temperature,
+                    self._batch_size,
+                    max_tokens,
+                    semaphore
+                )
+
+        return await self._acomplete_each(batches, model, temperature, max_tokens, semaphore)
+
+    async def _acomplete_each(
+        self,
+        batches: List[List[Message]],
+        model: str,
+        temperature: float,
+        max_tokens: Optional[int],
+        semaphore: asyncio.Semaphore
+    ) -> List[ModelResponse]:
+        """Complete each conversation with its own request, bounded by the semaphore"""
+        async def complete_one(messages: List[Message]) -> ModelResponse:
+            async with semaphore:
+                return await self._aget_chat_completion(messages, model, temperature, max_tokens)
+
+        return list(await asyncio.gather(*(complete_one(messages) for messages in batches)))
+
+    async def _aget_batched_chat_completion(
+        self,
+        prompt_groups: List[List[Message]],
+        model: str,
+        temperature: float,
+        batch_size: int,
+        max_tokens: Optional[int],
+        semaphore: asyncio.Semaphore
+    ) -> List[ModelResponse]:
+        """Answer independent prompts with one request per batch_size prompts
+
+        The prompts must share their system prompt, which is sent once per
+        batch rather than once per prompt. A batch whose reply cannot be split
+        back into one answer per prompt is retried one conversation at a time.
+        """
+        async def complete_group(group: List[List[Message]]) -> List[ModelResponse]:
+            async with semaphore:
+                response = await self._async_client.chat(
+                    model=model,
+                    messages=self._marshal_prompt_groups(group),
+                    format="json",
+                    options=_options(temperature)
+                )
+            try:
+                return self._unmarshal_batch_response(response, len(group))
+            except ProviderError as e:
+                if self.debug:
+                    logger.debug("Batched response unusable, completing individually: %s", e)
+                return await self._acomplete_each(group, model, temperature, max_tokens, semaphore)
+
+        try:
+            results = await asyncio.gather(*(
+                complete_group(prompt_groups[start:start + batch_size])
+                for start in range(0, len(prompt_groups), batch_size)
+            ))
+        except Exception as e:
+            raise ProviderError(f"Ollama async batched completion failed: {str(e)}")
+        return [response for group in results for response in group]
+
     async def _aget_json_completion(
             self,
             messages,
@@ -325,18 +615,14 @@ class OllamaProvider(LLMInterface):
                 model=model,
                 messages=messages,
                 format="json",
-                options={"temperature": temperature}
+                options=_options(temperature)
             )
 
             # Validate against schema
             content = response.message.content
-            try:
-                data = json.loads(content)
-                schema.model_validate(data)
-            except Exception as e:
-                raise ProviderError(f"Invalid JSON response: {str(e)}")
+            self._validate_json(schema, content)
 
-            return ModelResponse(
+            return self._create_response(
                 content=content,
                 raw_response=self._response_to_dict(response),
                 usage=self._extract_usage(response),
@@ -370,14 +656,14 @@ class OllamaProvider(LLMInterface):
 
                 # Convert messages and tools to dict format
                 message_dicts = self._format_messages(current_messages)
-                tool_dicts = [t.model_dump() for t in tools]
+                tool_dicts = self._tool_schemas(tools)
 
                 try:
                     response = await self._async_client.chat(
                         model=model,
                         messages=message_dicts,
                         tools=tool_dicts,
-                        options={"temperature": temperature}
+                        options=_options(temperature)
                     )
                 except Exception as api_error:
                     if self.debug:
@@ -416,7 +702,7 @@ class OllamaProvider(LLMInterface):
                         )
 
                         if tool:
-                            args = json.loads(self._format_arguments(tool_call.function.arguments))
+                            args = _loads(self._format_arguments(tool_call.function.arguments))
                             result = await tool.arun(**args)  # Use async tool call
 
                             if self.debug:
@@ -425,7 +711,7 @@ class OllamaProvider(LLMInterface):
                             # Add the tool's response
                             current_messages.append(Message(
                                 role=Role.TOOL,
-                                content=json.dumps(result) if isinstance(result, dict) else str(result),
+                                content=_dumps(result) if isinstance(result, dict) else str(result),
                                 tool_call_id=str(id),
                                 name=tool_call.function.name
                             ))
@@ -435,7 +721,7 @@ class OllamaProvider(LLMInterface):
                                 c for c in tool_call_data
                                 if c["id"] == str(id)
                             )
-                            call_data["result"] = json.dumps(result) if isinstance(result, dict) else str(result)
+                            call_data["result"] = _dumps(result) if isinstance(result, dict) else str(result)
                             all_tool_calls.append(call_data)
                     continue
 
@@ -450,7 +736,7 @@ class OllamaProvider(LLMInterface):
                     )
                     return json_response
 
-                return ModelResponse(
+                return self._create_response(
                     content=content,
                     raw_response=self._response_to_dict(response),
                     tool_calls=all_tool_calls if all_tool_calls else None,
@@ -462,21 +748,24 @@ class OllamaProvider(LLMInterface):
 
     def _response_to_dict(self, response: Any) -> Dict[str, Any]:
         """Convert Ollama response to dictionary"""
+        message = response.message
+        tool_calls = message.tool_calls
         return {
             "message": {
-                "role": response.message.role,
-                "content": response.message.content,
-                "tool_calls": [
+                "role": message.role,
+                "content": message.content,
+                "tool_calls": None if not tool_calls else [
                     {
-                        "id": tool_call.id,
-                        "type": tool_call.type,
+                        # Ollama tool calls carry no id or type of their own
+                        "id": f"call_{index}",
+                        "type": "function",
                         "function": {
                             "name": tool_call.function.name,
                             "arguments": tool_call.function.arguments
                         }
                     }
-                    for tool_call in (response.message.tool_calls or [])
-                ] if response.message.tool_calls else None
+                    for index, tool_call in enumerate(tool_calls)
+                ]
             },
             "model": response.model,
             "created_at": response.created_at
@@ -1,13 +1,17 @@
+import asyncio
+import json
+from types import SimpleNamespace
 from typing import List
 
 import pytest
 from dotenv import load_dotenv
-from pydantic import BaseModel
+from ollama import ChatResponse
+from pydantic import BaseModel, ValidationError
 
 from legion.errors import ProviderError
 from legion.interface.schemas import Message, ModelResponse, ProviderConfig, Role
 from legion.interface.tools import BaseTool
-from legion.providers.ollama import OllamaFactory, OllamaProvider
+from legion.providers.ollama import TOOL_SCHEMA_CACHE_SIZE, OllamaFactory, OllamaProvider, _schema_prompt
 
 # Load environment variables
 load_dotenv()
@@ -51,11 +55,210 @@ def test_provider_initialization(provider):
     assert isinstance(provider, OllamaProvider)
     assert provider.client is not None
 
+def test_client_timeouts():
+    timeout = OllamaProvider(config=ProviderConfig())._client_options()["timeout"]
+    assert timeout.read is None
+    assert timeout.connect == 10.0
+
+    timeout = OllamaProvider(config=ProviderConfig(timeout=30))._client_options()["timeout"]
+    assert timeout.read == 30
+    assert timeout.connect == 10.0
+
 def test_factory_creation(factory):
     config = ProviderConfig()
     provider = factory.create_provider(config=config)
     assert isinstance(provider, OllamaProvider)
 
+def test_accumulate_streaming_response(provider):
+    chunks = [
+        ChatResponse(message={"role": "assistant", "content": "Hello, "}),
+        None,
+        ChatResponse(message={"role": "assistant", "content": "World!"}),
+        ChatResponse(
+            message={"role": "assistant", "content": ""},
+            done=True,
+            prompt_eval_count=12,
+            eval_count=4
+        )
+    ]
+    response = provider._accumulate_streaming_response(iter(chunks))
+    assert response.message.content == "Hello, World!"
+    assert response.message.tool_calls is None
+
+    usage = provider._extract_usage(response)
+    assert usage.prompt_tokens == 12
+    assert usage.completion_tokens == 4
+    assert usage.total_tokens == 16
+
+def test_accumulate_streaming_tool_calls(provider):
+    tool_call = {"function": {"name": "simple_tool", "arguments": {"message": "hello"}}}
+    chunks = [
+        ChatResponse(message={"role": "assistant", "content": "", "tool_calls": [tool_call]}),
+        ChatResponse(message={"role": "assistant", "content": ""}, done=True)
+    ]
+    response = provider._accumulate_streaming_response(iter(chunks))
+    assert len(response.message.tool_calls) == 1
+    assert response.message.tool_calls[0].function.name == "simple_tool"
+
+def test_response_to_dict_tool_calls(provider):
+    # Ollama tool calls have no id or type, so both are synthesized
+    response = ChatResponse(message={
+        "role": "assistant",
+        "content": "",
+        "tool_calls": [{"function": {"name": "simple_tool", "arguments": {"message": "hello"}}}]
+    })
+    assert provider._response_to_dict(response)["message"]["tool_calls"] == [{
+        "id": "call_0",
+        "type": "function",
+        "function": {"name": "simple_tool", "arguments": {"message": "hello"}}
+    }]
+
+def test_accumulate_empty_stream(provider):
+    with pytest.raises(ProviderError):
+        provider._accumulate_streaming_response(iter([]))
+
+def test_extract_without_tool_calls_or_usage(provider):
+    response = ChatResponse(message={"role": "assistant", "content": "  Hello  "})
+    assert provider._extract_content(response) == "Hello"
+    assert provider._extract_tool_calls(response) is None
+    assert provider._extract_usage(response).total_tokens == 0
+
+def test_fast_response_skips_validation():
+    # content must be a str and token counts ints, so these only pass unvalidated
+    fast = OllamaProvider(config=ProviderConfig(fast_response=True))
+    response = fast._create_response(content=123, raw_response=None, usage=None, tool_calls=None)
+    assert isinstance(response, ModelResponse)
+    assert response.content == 123
+    assert fast._create_usage(1.5, 0).prompt_tokens == 1.5
+
+def test_validated_response_by_default(provider):
+    with pytest.raises(ValidationError):
+        provider._create_response(content=123, raw_response=None, usage=None, tool_calls=None)
+    with pytest.raises(ValidationError):
+        provider._create_usage(1.5, 0)
+
+def test_validate_json(provider):
+    provider._validate_json(TestSchema, '{"name": "John", "age": 25, "hobbies": ["reading"]}')
+
+    with pytest.raises(ProviderError) as exc_info:
+        provider._validate_json(TestSchema, '{"name": "John"}')
+    assert isinstance(exc_info.value.__cause__, ValidationError)
+
+def test_extract_tool_call_arguments(provider):
+    response = ChatResponse(message={
+        "role": "assistant",
+        "content": "",
+        "tool_calls": [{"function": {"name": "simple_tool", "arguments": {"message": "hello"}}}]
+    })
+    tool_calls = provider._extract_tool_calls(response)
+    assert tool_calls[0]["id"] == "call_0"
+    assert json.loads(tool_calls[0]["function"]["arguments"]) == {"message": "hello"}
+
+def test_string_tool_call_arguments_not_reencoded(provider):
+    # Arguments that are already a JSON string must not be encoded twice
+    arguments = '{"message": "hello"}'
+    response = SimpleNamespace(message=SimpleNamespace(tool_calls=[
+        SimpleNamespace(function=SimpleNamespace(name="simple_tool", arguments=arguments))
+    ]))
+    assert provider._extract_tool_calls(response)[0]["function"]["arguments"] == arguments
+
+    # The async tool loop decodes these back into keyword arguments
+    assert json.loads(provider._format_arguments(arguments)) == {"message": "hello"}
+    assert json.loads(provider._format_arguments({"message": "hello"})) == {"message": "hello"}
+
+class FakeStreamClient:
+    """Sync client that records chat() kwargs and streams a fixed reply"""
+
+    def __init__(self, content):
+        self.content = content
+        self.calls = []
+
+    def chat(self, **kwargs):
+        self.calls.append(kwargs)
+        return iter([
+            ChatResponse(message={"role": "assistant", "content": self.content}),
+            ChatResponse(message={"role": "assistant", "content": ""}, done=True)
+        ])
+
+JOHN = '{"name": "John", "age": 25, "hobbies": ["reading"]}'
+
+def test_json_completion_request(provider):
+    provider.client = FakeStreamClient(JOHN)
+    response = provider._get_json_completion(
+        messages=[Message(role=Role.USER, content="Tell me about John")],
+        model=MODEL,
+        schema=TestSchema,
+        temperature=0
+    )
+    assert response.content == JOHN
+
+    call = provider.client.calls[0]
+    assert call["format"] == "json"
+    assert dict(call["options"]) == {"temperature": 0}
+    assert "format" not in call["options"]
+    assert call["stream"] is True
+
+def test_json_completion_messages(provider):
+    provider.client = FakeStreamClient(JOHN)
+    provider._get_json_completion(
+        messages=[
+            Message(role=Role.SYSTEM, content="You are a helpful assistant"),
+            Message(role=Role.USER, content="Tell me about John"),
+            Message(role=Role.ASSISTANT, content="Sure")
+        ],
+        model=MODEL,
+        schema=TestSchema,
+        temperature=0
+    )
+
+    messages = provider.client.calls[0]["messages"]
+    assert messages[0] == {
+        "role": "system",
+        "content": f"You are a helpful assistant\n\n{_schema_prompt(TestSchema)}"
+    }
+    assert [message["role"] for message in messages] == ["system", "user", "assistant"]
+    assert messages[1:] == [
+        {"role": "user", "content": "Tell me about John"},
+        {"role": "assistant", "content": "Sure"}
+    ]
+
+def test_tool_schemas_cached(provider):
+    tools = [SimpleTool()]
+    schemas = provider._tool_schemas(tools)
+    assert schemas[0]["function"]["name"] == "simple_tool"
+    assert provider._tool_schemas(tools) is schemas
+    assert provider._tool_schemas([SimpleTool()]) is not schemas
+
+def test_tool_schema_cache_bounded(provider):
+    first = [SimpleTool()]
+    provider._tool_schemas(first)
+    for _ in range(TOOL_SCHEMA_CACHE_SIZE):
+        provider._tool_schemas([SimpleTool()])
+
+    # Least recently used tool sets are evicted along with their tool references
+    assert len(provider._tool_schema_cache) == TOOL_SCHEMA_CACHE_SIZE
+    assert (id(first[0]),) not in provider._tool_schema_cache
+
+def test_schema_prompt_cached():
+    prompt = _schema_prompt(TestSchema)
+    assert '"hobbies"' in prompt
+    assert prompt.endswith("Respond ONLY with valid JSON. No other text.")
+    assert _schema_prompt(TestSchema) is prompt
+
+def test_format_messages(provider):
+    messages = [
+        Message(role=Role.SYSTEM, content="system"),
+        Message(role=Role.USER, content="user"),
+        Message(role=Role.ASSISTANT, content="assistant"),
+        Message(role=Role.TOOL, content="result", name="simple_tool")
+    ]
+    assert provider._format_messages(messages) == [
+        {"role": "system", "content": "system"},
+        {"role": "user", "content": "user"},
+        {"role": "assistant", "content": "assistant"},
+        {"role": "tool", "content": "result", "name": "simple_tool"}
+    ]
+
 @pytest.mark.asyncio
 async def test_basic_completion(provider):
     messages = [
@@ -149,6 +352,129 @@ async def test_async_completion(provider):
     assert isinstance(response.content, str)
     assert len(response.content) > 0
 
+@pytest.mark.asyncio
+async def test_async_client_initialized_once(provider, monkeypatch):
+    setup_calls = []
+
+    async def fake_setup():
+        setup_calls.append(True)
+        await asyncio.sleep(0)
+        provider._async_client = object()
+
+    monkeypatch.setattr(provider, "_asetup_client", fake_setup)
+    await asyncio.gather(*(provider._ensure_async_client() for _ in range(10)))
+    assert len(setup_calls) == 1
+
+class FakeBatchClient:
+    """Async client that answers batched requests and single prompts"""
+
+    def __init__(self, batch_reply=None):
+        self.batch_reply = batch_reply
+        self.calls = []
+
+    async def chat(self, model, messages, options, format=None):
+        self.calls.append({"messages": messages, "format": format})
+        if format == "json":
+            queries = messages[-1]["content"].split("\n\n")
+            answers = [query.split("\n", 1)[1].upper() for query in queries]
+            content = self.batch_reply if self.batch_reply is not None else json.dumps({"responses": answers})
+        else:
+            content = messages[-1]["content"].upper()
+        return ChatResponse(message={"role": "assistant", "content": content})
+
+def batch_provider(**config):
+    provider = OllamaProvider(config=ProviderConfig(**config))
+    provider._async_client = FakeBatchClient()
+    return provider
+
+def conversations(*texts, system="Be brief"):
+    return [[Message(role=Role.SYSTEM, content=system), Message(role=Role.USER, content=text)] for text in texts]
+
+@pytest.mark.asyncio
+async def test_abatch_complete(provider):
+    provider._async_client = FakeBatchClient()
+    batches = [[Message(role=Role.USER, content=text)] for text in ["one", "two", "three"]]
+    responses = await provider.abatch_complete(batches, model=MODEL, temperature=0)
+    assert [response.content for response in responses] == ["ONE", "TWO", "THREE"]
+    assert all(call["format"] is None for call in provider._async_client.calls)
+
+@pytest.mark.asyncio
+async def test_abatch_complete_marshals_above_threshold():
+    provider = batch_provider(batch_threshold=3, batch_size=2)
+    responses = await provider.abatch_complete(conversations("one", "two", "three"), model=MODEL)
+    assert [response.content for response in responses] == ["ONE", "TWO", "THREE"]
+
+    calls = provider._async_client.calls
+    assert len(calls) == 2
+    assert all(call["format"] == "json" for call in calls)
+    assert calls[0]["messages"][0]["content"].startswith("Be brief")
+
+@pytest.mark.asyncio
+async def test_abatch_complete_below_threshold_or_mixed_system():
+    provider = batch_provider(batch_threshold=3)
+    await provider.abatch_complete(conversations("one", "two"), model=MODEL)
+    assert len(provider._async_client.calls) == 2
+
+    provider = batch_provider(batch_threshold=2)
+    mixed = conversations("one") + conversations("two", system="Be verbose")
+    responses = await provider.abatch_complete(mixed, model=MODEL)
+    assert [response.content for response in responses] == ["ONE", "TWO"]
+    assert all(call["format"] is None for call in provider._async_client.calls)
+
+@pytest.mark.asyncio
+async def test_abatch_complete_sends_multi_turn_individually():
+    provider = batch_provider(batch_threshold=2)
+    multi_turn = conversations("one")
+    multi_turn[0].extend([Message(role=Role.ASSISTANT, content="ONE"), Message(role=Role.USER, content="again")])
+    multi_turn.append(conversations("two")[0])
+    responses = await provider.abatch_complete(multi_turn, model=MODEL)
+    assert [response.content for response in responses] == ["AGAIN", "TWO"]
+    assert all(call["format"] is None for call in provider._async_client.calls)
+
+@pytest.mark.parametrize("option", [{"batch_size": 0}, {"batch_threshold": -1}, {"batch_size": "8"}])
+def test_invalid_batch_options(option):
+    with pytest.raises(ProviderError):
+        OllamaProvider(config=ProviderConfig(**option))
+
+@pytest.mark.asyncio
+async def test_abatch_complete_falls_back_on_bad_batch_reply():
+    for batch_reply in ['{"responses": ["ONLY ONE"]}', "not json"]:
+        provider = batch_provider(batch_threshold=2)
+        provider._async_client.batch_reply = batch_reply
+        responses = await provider.abatch_complete(conversations("one", "two"), model=MODEL)
+        assert [response.content for response in responses] == ["ONE", "TWO"]
+        assert [call["format"] for call in provider._async_client.calls] == ["json", None, None]
+
+def test_marshal_prompt_groups(provider):
+    groups = [
+        [Message(role=Role.SYSTEM, content="Be brief"), Message(role=Role.USER, content=text)]
+        for text in ["one", "two"]
+    ]
+    messages = provider._marshal_prompt_groups(groups)
+    assert len(messages) == 2
+    assert messages[0]["role"] == "system"
+    assert messages[0]["content"].startswith("Be brief")
+    assert "2 queries" in messages[0]["content"]
+    assert messages[1]["content"] == "Query 1:\none\n\nQuery 2:\ntwo"
+
+    mixed = [groups[0], [Message(role=Role.SYSTEM, content="Be verbose"), Message(content="three")]]
+    with pytest.raises(ProviderError):
+        provider._marshal_prompt_groups(mixed)
+
+def test_unmarshal_batch_response(provider):
+    response = ChatResponse(
+        message={"role": "assistant", "content": '{"responses": ["ONE", "TWO", "THREE"]}'},
+        prompt_eval_count=10,
+        eval_count=7
+    )
+    responses = provider._unmarshal_batch_response(response, 3)
+    assert [r.content for r in responses] == ["ONE", "TWO", "THREE"]
+    assert sum(r.usage.prompt_tokens for r in responses) == 10
+    assert sum(r.usage.completion_tokens for r in responses) == 7
+
+    with pytest.raises(ProviderError):
+        provider._unmarshal_batch_response(response, 2)
+
 @pytest.mark.asyncio
 async def test_invalid_model(provider):
     messages = [Message(role=Role.USER, content="test")]